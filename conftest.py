@@ -0,0 +1,48 @@
+# conftest.py
+# Shared pytest setup for the Day 1 test suite
+
+import os
+import sys
+import time
+
+import pytest
+
+# Pipeline modules use flat imports, so src/ goes on the path once per session
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# Address-space cap per xdist worker, so `pytest -n auto` cannot exhaust RAM
+WORKER_MEMORY_LIMIT = 1 << 30
+
+VEHICLES_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'processed',
+                            'motor-vehicles-registered-by-type-division-and-district-the-punjab-uptil-2021.csv')
+
+@pytest.fixture(scope='session')
+def vehicle_df():
+    """Vehicle registration CSV parsed once per session (or per xdist worker)"""
+    if not os.path.exists(VEHICLES_CSV):
+        pytest.skip("vehicle registration CSV not available")
+    import pandas as pd
+    return pd.read_csv(VEHICLES_CSV, thousands=',', na_values=['nan', '']).rename(columns=str.strip)
+
+@pytest.fixture(scope='session', autouse=True)
+def _cap_worker_memory():
+    """Limit each xdist worker's virtual memory; serial runs are left alone"""
+    if not os.environ.get('PYTEST_XDIST_WORKER'):
+        yield
+        return
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        yield
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = WORKER_MEMORY_LIMIT if hard == resource.RLIM_INFINITY else min(WORKER_MEMORY_LIMIT, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    yield
+    resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+def pytest_report_header(config):
+    """Start time in the session header; pytest reports the elapsed time itself"""
+    return f"Test started: {time.strftime('%Y-%m-%d %H:%M:%S')}"
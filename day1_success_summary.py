@@ -3,19 +3,24 @@
 
 import json
 import os
-from datetime import datetime
+import time
+
+try:
+    import orjson
+except ImportError:  # fall back to the standard library parser
+    orjson = None
 
 def show_day1_success():
     """Display comprehensive Day 1 success summary"""
     
     print("🎉 DAY 1 COMPLETE: LAHORE SMART CITY PROJECT")
     print("=" * 60)
-    print(f"Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Completed: {time.strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Load summary
     try:
-        with open('day1_summary.json', 'r') as f:
-            data = json.load(f)
+        with open('day1_summary.json', 'rb') as f:
+            data = orjson.loads(f.read()) if orjson else json.load(f)
         
         summary = data['summary']
         
@@ -2,11 +2,34 @@
 # Helper script to locate your data files
 
 import os
-import glob
+from functools import lru_cache
 from pathlib import Path
 
-def find_data_files():
-    """Search for data files in common locations"""
+# Directories do not change during a single search, so path lookups are memoized
+@lru_cache(maxsize=None)
+def _isdir(path):
+    return os.path.isdir(path)
+
+@lru_cache(maxsize=None)
+def _abspath(path):
+    return os.path.abspath(path)
+
+@lru_cache(maxsize=None)
+def _list_dir(path):
+    """Map visible entry names to paths (hidden entries are skipped, as glob did)"""
+    if not _isdir(path):
+        return None
+    try:
+        with os.scandir(path) as entries:
+            return {e.name: e.path for e in entries if not e.name.startswith('.')}
+    except OSError:
+        return None
+
+def find_data_files(find_all: bool = False):
+    """Search for data files in common locations
+    
+    Stops at the first search path containing a match unless find_all is set.
+    """
     
     target_files = [
         "motorvehiclesregisteredbytypedivisionanddistrictthepunjabuptil2021.csv",
@@ -31,27 +54,36 @@ def find_data_files():
     
     found_files = {}
     
+    # Partial-match prefixes are fixed per target, so compute them once
+    prefixes = {file_name: file_name[:20] for file_name in target_files}
+    
     for file_name in target_files:
         print(f"\n📁 Looking for: {file_name}")
         found_locations = []
         
         for search_path in search_paths:
-            if os.path.exists(search_path):
-                # Search in directory
-                full_path = os.path.join(search_path, file_name)
-                if os.path.exists(full_path):
-                    abs_path = os.path.abspath(full_path)
-                    found_locations.append(abs_path)
-                    print(f"   ✅ Found: {abs_path}")
-                
-                # Also search with wildcards for partial matches
-                pattern = os.path.join(search_path, f"*{file_name[:20]}*")
-                matches = glob.glob(pattern)
-                for match in matches:
-                    if match not in found_locations:
-                        abs_path = os.path.abspath(match)
+            # Each directory is listed at most once, and only when reached
+            entries = _list_dir(search_path)
+            if entries is None:
+                continue
+            
+            # Search in directory
+            if file_name in entries:
+                abs_path = _abspath(entries[file_name])
+                found_locations.append(abs_path)
+                print(f"   ✅ Found: {abs_path}")
+            
+            # Also search for partial matches
+            prefix = prefixes[file_name]
+            for name, path in entries.items():
+                if prefix in name:
+                    abs_path = _abspath(path)
+                    if abs_path not in found_locations:
                         found_locations.append(abs_path)
                         print(f"   🔍 Similar: {abs_path}")
+            
+            if found_locations and not find_all:
+                break
         
         if not found_locations:
             print(f"   ❌ Not found in common locations")
@@ -65,13 +97,14 @@ def find_data_files():
     
     all_found = True
     copy_commands = []
+    cwd = os.getcwd()
     
     for file_name, locations in found_files.items():
         if locations:
             print(f"✅ {file_name}")
             if len(locations) == 1:
                 source_path = locations[0]
-                if os.path.dirname(source_path) != os.getcwd():
+                if os.path.dirname(source_path) != cwd:
                     copy_commands.append(f'Copy-Item "{source_path}" "."')
             else:
                 print(f"   Multiple copies found:")
@@ -120,7 +153,10 @@ def generate_search_commands():
     print(f'Get-ChildItem -Path C:\\Users\\user -Recurse -Include "*.csv","*.xlsx" -ErrorAction SilentlyContinue | Where-Object {{$_.Name -like "*punjab*" -or $_.Name -like "*accident*" -or $_.Name -like "*vehicle*"}}')
 
 if __name__ == "__main__":
-    found_files = find_data_files()
+    import sys
+    
+    # --all keeps searching every location to report duplicate copies
+    found_files = find_data_files(find_all='--all' in sys.argv)
     generate_search_commands()
     
     # Quick test
@@ -7,15 +7,15 @@ def fix_accident_data():
     """Fix the trailing space in YEAR column"""
     try:
         # Load the accident data
-        df = pd.read_excel("data/processed/accidents-district-wise-punjab.xlsx", sheet_name=0)
+        df = pd.read_excel("data/processed/accidents-district-wise-punjab.xlsx", sheet_name=0, engine='calamine')
         
         # Clean column names (remove trailing spaces)
-        df.columns = df.columns.str.strip()
+        df.rename(columns=str.strip, inplace=True)
         
         print("Original columns:", list(df.columns))
         
         # Check for Lahore data
-        lahore_data = df[df['DISTRICT'].str.contains('Lahore', case=False, na=False)]
+        lahore_data = df[df['DISTRICT'].str.contains('Lahore', case=False, na=False, regex=False)]
         
         print(f"✅ Fixed column names")
         print(f"📊 Lahore accident records: {len(lahore_data)}")
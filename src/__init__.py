@@ -22,11 +22,24 @@ __version__ = "1.0.0"
 __author__ = "Smart City Development Team"
 __description__ = "Lahore Smart City Management System - Data Collection Pipeline"
 
-# Import main classes for easy access
-from .data_collection import LahoreDataCollector
-from .synthetic_generators import LahoreSyntheticGenerator
-from .data_validation import SmartCityDataValidator
-from .main_pipeline import Day1Pipeline
+import importlib
+
+# Main classes are re-exported lazily (PEP 562) so that reading package
+# metadata does not pull in pandas, numpy and requests
+_LAZY_EXPORTS = {
+    'LahoreDataCollector': 'data_collection',
+    'LahoreSyntheticGenerator': 'synthetic_generators',
+    'SmartCityDataValidator': 'data_validation',
+    'Day1Pipeline': 'main_pipeline'
+}
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'LahoreDataCollector',
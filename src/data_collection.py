@@ -4,12 +4,63 @@
 import pandas as pd
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
-import warnings
-warnings.filterwarnings('ignore')
+import io
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from utils import DataUtils
+
+def _read_csv_prefiltered(path: str, keyword: str, **read_kwargs) -> pd.DataFrame:
+    """Read a CSV keeping only the header and the lines that mention keyword"""
+    keyword = keyword.lower()
+    # Matching lines are streamed straight into one buffer, so peak memory is
+    # bounded by the kept rows rather than the whole file
+    buffer = io.StringIO()
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        buffer.write(f.readline())
+        for line in f:
+            if keyword in line.lower():
+                buffer.write(line)
+    buffer.seek(0)
+    return pd.read_csv(buffer, **read_kwargs)
+
+_COMMA_TABLE = str.maketrans('', '', ',')
+
+def _coerce_numeric(df: pd.DataFrame, downcast: Optional[str] = None) -> pd.DataFrame:
+    """Convert columns to numbers, stripping separators left in any text columns"""
+    def convert(col: pd.Series) -> pd.Series:
+        if not pd.api.types.is_numeric_dtype(col):
+            col = col.astype(str).str.translate(_COMMA_TABLE)
+        col = pd.to_numeric(col, errors='coerce').fillna(0)
+        # Narrowest dtype that holds the counts (e.g. uint32 instead of int64)
+        return pd.to_numeric(col, downcast=downcast) if downcast else col
+    
+    return df.apply(convert)
+
+# Parsed sources are cached per (path, mtime); callers must copy before mutating
+@lru_cache(maxsize=8)
+def _read_vehicles(path: str, mtime: float) -> pd.DataFrame:
+    """Parse the Lahore rows of the vehicle registration CSV"""
+    df = _read_csv_prefiltered(path, 'Lahore', engine='c', thousands=',', na_values=['nan', ''])
+    return df.rename(columns=str.strip)
+
+@lru_cache(maxsize=8)
+def _read_accidents(path: str, mtime: float) -> pd.DataFrame:
+    """Parse the district-wise accident workbook"""
+    # Header cells carry stray whitespace ('YEAR '); normalize once at read time
+    return pd.read_excel(path, sheet_name=0, engine='calamine').rename(columns=str.strip)
+
+@lru_cache(maxsize=8)
+def _read_healthcare(path: str, mtime: float) -> pd.DataFrame:
+    """Parse the healthcare infrastructure CSV"""
+    return pd.read_csv(path, thousands=',', na_values=['nan', ''])
 
 class LahoreDataCollector:
     """Data collection pipeline for Lahore Smart City Management"""
@@ -20,31 +71,41 @@ class LahoreDataCollector:
         self.data_sources = {
             "traffic_vehicles": "data/processed/motor-vehicles-registered-by-type-division-and-district-the-punjab-uptil-2021.csv",
             "traffic_accidents": "data/processed/accidents-district-wise-punjab.xlsx", 
-            "healthcare": "data/processed/number-of-hospitals-dispensaries-maternity-rural-health-centre-and-number-of-beds-in-pakistan-2.csv",
-            "traffic_annual": "data/processed/traffic-accidents-annual.xlsx"
+            "healthcare": "data/processed/number-of-hospitals-dispensaries-maternity-rural-health-centre-and-number-of-beds-in-pakistan-2.csv"
         }
         self.collected_data = {}
+        
+        # Weather responses keyed by (lat, lon) -> (fetched_at, data), reused for weather_cache_ttl seconds
+        self.weather_cache_ttl = 300
+        self._weather_cache = {}
+        
+        # Pooled keep-alive session reused across weather API calls
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=3, backoff_factor=0.2))
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
     
-    def collect_traffic_data(self) -> Dict:
+    def collect_traffic_data(self, vehicles_df: Optional[pd.DataFrame] = None) -> Dict:
         """Collect traffic data from vehicle registration and accidents"""
         traffic_data = {}
         
         # Vehicle registration data
         try:
-            df_vehicles = pd.read_csv(self.data_sources["traffic_vehicles"])
-            df_vehicles.columns = df_vehicles.columns.str.strip()
+            if vehicles_df is not None:
+                # Already-parsed registrations (e.g. a shared test fixture)
+                df_vehicles = vehicles_df.copy()
+            else:
+                # Only Lahore lines reach the parser; thousands separators are
+                # stripped by the C parser in one pass
+                path = self.data_sources["traffic_vehicles"]
+                df_vehicles = _read_vehicles(path, os.path.getmtime(path)).copy()
             
-            lahore_vehicles = df_vehicles[
-                df_vehicles['Division/ District'].str.contains('Lahore', case=False, na=False)
-            ].copy()
+            lahore_vehicles = df_vehicles[DataUtils.lahore_mask(df_vehicles['Division/ District'])].copy()
             
             # Clean numeric columns
             numeric_cols = [col for col in lahore_vehicles.columns if col != 'Division/ District']
-            for col in numeric_cols:
-                lahore_vehicles[col] = (lahore_vehicles[col].astype(str)
-                                      .str.replace(',', '')
-                                      .str.replace('nan', '0'))
-                lahore_vehicles[col] = pd.to_numeric(lahore_vehicles[col], errors='coerce').fillna(0)
+            lahore_vehicles[numeric_cols] = _coerce_numeric(lahore_vehicles[numeric_cols], downcast='unsigned')
             
             traffic_data['vehicles'] = lahore_vehicles
             
@@ -54,15 +115,13 @@ class LahoreDataCollector:
         
         # Accident data  
         try:
-            df_accidents = pd.read_excel(self.data_sources["traffic_accidents"], sheet_name=0)
-            df_accidents.columns = df_accidents.columns.str.strip()
+            path = self.data_sources["traffic_accidents"]
+            df_accidents = _read_accidents(path, os.path.getmtime(path)).copy()
             
-            lahore_accidents = df_accidents[
-                df_accidents['DISTRICT'].str.contains('Lahore', case=False, na=False)
-            ].copy()
+            lahore_accidents = df_accidents[DataUtils.lahore_mask(df_accidents['DISTRICT'])].copy()
             
             lahore_accidents['NO OF CASES'] = pd.to_numeric(lahore_accidents['NO OF CASES'], errors='coerce')
-            lahore_accidents['YEAR '] = pd.to_numeric(lahore_accidents['YEAR '], errors='coerce')
+            lahore_accidents['YEAR'] = pd.to_numeric(lahore_accidents['YEAR'], errors='coerce')
             
             traffic_data['accidents'] = lahore_accidents
             
@@ -73,10 +132,22 @@ class LahoreDataCollector:
         self.collected_data['traffic'] = traffic_data
         return traffic_data
     
+    def _fetch_json(self, url: str, params: Dict) -> Dict:
+        """GET a JSON document from the weather API"""
+        response = self._http.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        return response.json()
+    
     def collect_weather_data(self) -> Optional[Dict]:
         """Collect weather data from OpenWeatherMap API"""
+        cache_key = (self.lahore_coords['lat'], self.lahore_coords['lon'])
+        cached = self._weather_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self.weather_cache_ttl:
+            self.collected_data['weather'] = cached[1]
+            return cached[1]
+        
         try:
-            url = f"http://api.openweathermap.org/data/2.5/weather"
+            url = f"https://api.openweathermap.org/data/2.5/weather"
             params = {
                 'lat': self.lahore_coords['lat'],
                 'lon': self.lahore_coords['lon'], 
@@ -84,21 +155,22 @@ class LahoreDataCollector:
                 'units': 'metric'
             }
             
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            weather_data = response.json()
-            
-            # Try air quality
-            try:
-                air_url = f"http://api.openweathermap.org/data/2.5/air_pollution"
-                air_response = requests.get(air_url, params=params, timeout=10)
-                air_response.raise_for_status()
-                air_data = air_response.json()
-                weather_data['air_quality'] = air_data
-            except:
-                weather_data['air_quality'] = None
-            
+            air_url = f"https://api.openweathermap.org/data/2.5/air_pollution"
+            
+            # Weather and air quality are independent, so both requests are in flight together
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                weather_future = executor.submit(self._fetch_json, url, params)
+                air_future = executor.submit(self._fetch_json, air_url, params)
+                
+                weather_data = weather_future.result()
+                
+                # Try air quality
+                try:
+                    weather_data['air_quality'] = air_future.result()
+                except:
+                    weather_data['air_quality'] = None
+            
+            self._weather_cache[cache_key] = (time.monotonic(), weather_data)
             self.collected_data['weather'] = weather_data
             return weather_data
             
@@ -110,15 +182,12 @@ class LahoreDataCollector:
     def collect_healthcare_data(self) -> Optional[pd.DataFrame]:
         """Collect healthcare infrastructure data"""
         try:
-            df = pd.read_csv(self.data_sources["healthcare"])
+            path = self.data_sources["healthcare"]
+            df = _read_healthcare(path, os.path.getmtime(path)).copy()
             
             # Clean numeric columns
-            for col in df.columns:
-                if col != 'Year':
-                    df[col] = (df[col].astype(str)
-                             .str.replace(',', '')
-                             .str.replace('nan', '0'))
-                    df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+            numeric_cols = [col for col in df.columns if col != 'Year']
+            df[numeric_cols] = _coerce_numeric(df[numeric_cols], downcast='integer')
             
             self.collected_data['healthcare'] = df
             return df
@@ -130,13 +199,17 @@ class LahoreDataCollector:
     
     def run_collection_pipeline(self) -> Dict:
         """Execute complete data collection pipeline"""
-        collection_results = {
-            'traffic': self.collect_traffic_data(),
-            'weather': self.collect_weather_data(), 
-            'healthcare': self.collect_healthcare_data(),
-            'collection_timestamp': datetime.now().isoformat(),
-            'status': {}
-        }
+        # Collectors are independent: file parsing overlaps with the weather API round trip
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                'traffic': executor.submit(self.collect_traffic_data),
+                'weather': executor.submit(self.collect_weather_data),
+                'healthcare': executor.submit(self.collect_healthcare_data)
+            }
+            collection_results = {key: future.result() for key, future in futures.items()}
+        
+        collection_results['collection_timestamp'] = datetime.now().isoformat()
+        collection_results['status'] = {}
         
         # Status tracking
         for key, data in collection_results.items():
@@ -3,10 +3,81 @@
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+import os
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from typing import Dict, List, Tuple, Optional
-import warnings
-warnings.filterwarnings('ignore')
+
+from utils import DataUtils
+
+_HOUR_NS = 3_600_000_000_000
+
+# Score thresholds and the status for each band (<70, 70-80, 80-90, >=90)
+_QUALITY_THRESHOLDS = (70, 80, 90)
+_QUALITY_STATUSES = ("Poor", "Fair", "Good", "Excellent")
+
+# Worker processes only pay off once there is this much data to validate
+PARALLEL_MIN_ROWS = 2_000_000
+
+# Decimal places for summary statistics in validation reports
+STAT_DECIMALS = 2
+
+# Issue messages kept per dataset (the first ones); further issues still count and cost score
+MAX_ISSUES = 50
+
+class ValidationResult:
+    """Score, issues and per-dataset details collected by one validator"""
+    __slots__ = ('data_type', 'total_records', 'details_key', 'issues', 'issue_count',
+                 'quality_score', 'details')
+    
+    def __init__(self, data_type: str, total_records: int, details_key: str):
+        self.data_type = data_type
+        self.total_records = total_records
+        self.details_key = details_key
+        self.issues = []
+        self.issue_count = 0
+        self.quality_score = 100
+        self.details = {}
+    
+    def add_issue(self, message: str, penalty: int) -> None:
+        """Record an issue and deduct its penalty; only the first MAX_ISSUES messages are kept"""
+        if self.issue_count < MAX_ISSUES:
+            self.issues.append(message)
+        self.issue_count += 1
+        self.quality_score -= penalty
+    
+    def to_dict(self) -> Dict:
+        """Plain dict in the export layout"""
+        return {
+            'data_type': self.data_type,
+            'total_records': self.total_records,
+            'issues': list(self.issues),
+            'issue_count': self.issue_count,
+            'quality_score': self.quality_score,
+            self.details_key: self.details
+        }
+
+def _count_out_of_bounds(lat: np.ndarray, lon: np.ndarray,
+                         lat_bounds: Tuple[float, float], lon_bounds: Tuple[float, float]) -> int:
+    """Count points outside the bounding box, reusing one mask buffer (NaN counts as inside)"""
+    outside = np.less(lat, lat_bounds[0])
+    outside |= np.greater(lat, lat_bounds[1])
+    outside |= np.less(lon, lon_bounds[0])
+    outside |= np.greater(lon, lon_bounds[1])
+    return int(np.count_nonzero(outside))
+
+# Value-check counters are module-level so validators stay picklable for worker processes
+def _count_nulls(values: pd.DataFrame) -> pd.Series:
+    return values.isna().sum()
+
+def _count_negatives(values: pd.DataFrame) -> pd.Series:
+    return values.lt(0).sum()
+
+def _run_validator(task: Tuple) -> Tuple[str, Dict]:
+    """Run one (dataset_name, validator_method, df) task in a worker process"""
+    dataset_name, validator_method, data = task
+    return dataset_name, validator_method(data)
 
 class SmartCityDataValidator:
     """Comprehensive data validation pipeline for Lahore Smart City data"""
@@ -14,262 +85,247 @@ class SmartCityDataValidator:
     def __init__(self):
         self.validation_results = {}
         self.error_threshold = 0.05
+        self.max_workers = os.cpu_count() or 1
         
         self.schemas = {
             'vehicles': ['Division/ District', 'Total', 'Motor Cars, Jeeps and Station Wagons'],
-            'accidents': ['YEAR ', 'PROVINCE', 'DISTRICT', 'ACCIDENT/CAUSALITIES', 'NO OF CASES'],
+            'accidents': ['YEAR', 'PROVINCE', 'DISTRICT', 'ACCIDENT/CAUSALITIES', 'NO OF CASES'],
             'healthcare': ['Year', 'Hospitals', 'Dispensaries', 'Total Beds'],
             'energy': ['timestamp', 'total_consumption_mw', 'residential_mw'],
             'emergency': ['request_id', 'timestamp', 'service_type', 'priority', 'status']
         }
+        self._schema_sets = {name: frozenset(cols) for name, cols in self.schemas.items()}
+        
+        # Dataset name -> bound validator, resolved once rather than per run
+        self._dispatch = {
+            'traffic_vehicles': self.validate_vehicle_data,
+            'traffic_accidents': self.validate_accident_data,
+            'healthcare': self.validate_healthcare_data,
+            'energy': self.validate_synthetic_energy,
+            'emergency': self.validate_synthetic_emergency
+        }
+        
+        # Vectorized value checks per dataset: (issue label, score penalty, failure counter)
+        self.value_checks = {
+            'energy': [
+                ('Null values', 5, _count_nulls),
+                ('Negative values', 10, _count_negatives)
+            ]
+        }
+    
+    def _missing_columns(self, schema: str, df: pd.DataFrame) -> List[str]:
+        """Expected columns of a schema that the frame does not have"""
+        return sorted(self._schema_sets[schema].difference(df.columns))
+    
+    def _parse_timestamps(self, df: pd.DataFrame) -> pd.Series:
+        """Parse the timestamp column with the ISO 8601 fast path"""
+        return pd.to_datetime(df['timestamp'], format='ISO8601', cache=True)
+    
+    def _clean_numeric_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Strip thousands separators and coerce all columns to numbers in one pass"""
+        cleaned = df.astype(str).replace({',': '', r'^nan$': '0'}, regex=True)
+        return cleaned.apply(pd.to_numeric, errors='coerce')
     
     def validate_vehicle_data(self, df: pd.DataFrame) -> Dict:
         """Validate vehicle registration data quality"""
-        validation = {
-            'data_type': 'vehicles',
-            'total_records': len(df),
-            'issues': [],
-            'quality_score': 100,
-            'lahore_specific': {}
-        }
+        validation = ValidationResult('vehicles', len(df), 'lahore_specific')
         
         # Schema validation
-        missing_cols = [col for col in self.schemas['vehicles'] if col not in df.columns]
+        missing_cols = self._missing_columns('vehicles', df)
         if missing_cols:
-            validation['issues'].append(f"Missing columns: {missing_cols}")
-            validation['quality_score'] -= 20
+            validation.add_issue(f"Missing columns: {missing_cols}", 20)
         
         # Lahore data validation
-        lahore_records = df[df['Division/ District'].str.contains('Lahore', case=False, na=False)]
-        validation['lahore_specific']['records_found'] = len(lahore_records)
+        lahore_records = df[DataUtils.lahore_mask(df['Division/ District'])]
+        validation.details['records_found'] = len(lahore_records)
         
         if len(lahore_records) == 0:
-            validation['issues'].append("No Lahore records found")
-            validation['quality_score'] -= 30
+            validation.add_issue("No Lahore records found", 30)
         else:
             # Validate numeric data
             numeric_cols = [col for col in df.columns if col != 'Division/ District']
-            for col in numeric_cols:
-                if col in lahore_records.columns:
-                    try:
-                        cleaned = lahore_records[col].astype(str).str.replace(',', '').str.replace('nan', '0')
-                        numeric_values = pd.to_numeric(cleaned, errors='coerce')
-                        null_count = numeric_values.isnull().sum()
-                        
-                        if null_count > 0:
-                            validation['issues'].append(f"Invalid values in {col}: {null_count}")
-                            validation['quality_score'] -= 5
-                        
-                        if col == 'Total' and not numeric_values.empty:
-                            total_vehicles = numeric_values.iloc[0]
-                            if total_vehicles < 1000000 or total_vehicles > 10000000:
-                                validation['issues'].append(f"Unusual total vehicle count: {total_vehicles}")
-                                validation['quality_score'] -= 10
-                            
-                            validation['lahore_specific']['total_vehicles'] = int(total_vehicles)
+            try:
+                numeric_values = self._clean_numeric_frame(lahore_records[numeric_cols])
+                null_counts = numeric_values.isna().sum(axis=0)
+                
+                for col, null_count in null_counts.items():
+                    if null_count > 0:
+                        validation.add_issue(f"Invalid values in {col}: {null_count}", 5)
+                
+                if 'Total' in numeric_values.columns:
+                    total_vehicles = numeric_values['Total'].iloc[0]
+                    if total_vehicles < 1000000 or total_vehicles > 10000000:
+                        validation.add_issue(f"Unusual total vehicle count: {total_vehicles}", 10)
                     
-                    except Exception as e:
-                        validation['issues'].append(f"Error processing {col}: {str(e)}")
-                        validation['quality_score'] -= 10
+                    validation.details['total_vehicles'] = int(total_vehicles)
+            
+            except Exception as e:
+                validation.add_issue(f"Error processing numeric columns: {str(e)}", 10)
         
-        return validation
+        return validation.to_dict()
     
     def validate_accident_data(self, df: pd.DataFrame) -> Dict:
         """Validate traffic accident data quality"""
-        validation = {
-            'data_type': 'accidents',
-            'total_records': len(df),
-            'issues': [],
-            'quality_score': 100,
-            'lahore_specific': {}
-        }
+        validation = ValidationResult('accidents', len(df), 'lahore_specific')
         
-        missing_cols = [col for col in self.schemas['accidents'] if col not in df.columns]
+        missing_cols = self._missing_columns('accidents', df)
         if missing_cols:
-            validation['issues'].append(f"Missing columns: {missing_cols}")
-            validation['quality_score'] -= 20
+            validation.add_issue(f"Missing columns: {missing_cols}", 20)
         
-        lahore_records = df[df['DISTRICT'].str.contains('Lahore', case=False, na=False)]
-        validation['lahore_specific']['records_found'] = len(lahore_records)
+        lahore_records = df[DataUtils.lahore_mask(df['DISTRICT'])]
+        validation.details['records_found'] = len(lahore_records)
         
         if len(lahore_records) == 0:
-            validation['issues'].append("No Lahore accident records found")
-            validation['quality_score'] -= 30
+            validation.add_issue("No Lahore accident records found", 30)
         else:
-            if 'YEAR ' in lahore_records.columns:
-                years = pd.to_numeric(lahore_records['YEAR '], errors='coerce')
+            if 'YEAR' in lahore_records.columns:
+                years = pd.to_numeric(lahore_records['YEAR'], errors='coerce')
                 valid_years = years.dropna()
                 
                 if len(valid_years) != len(years):
-                    validation['issues'].append("Invalid year values found")
-                    validation['quality_score'] -= 10
+                    validation.add_issue("Invalid year values found", 10)
                 
                 if not valid_years.empty:
                     year_range = f"{valid_years.min()}-{valid_years.max()}"
-                    validation['lahore_specific']['year_range'] = year_range
+                    validation.details['year_range'] = year_range
                     
                     if valid_years.min() < 2000 or valid_years.max() > datetime.now().year:
-                        validation['issues'].append(f"Unusual year range: {year_range}")
-                        validation['quality_score'] -= 10
+                        validation.add_issue(f"Unusual year range: {year_range}", 10)
             
             if 'NO OF CASES' in lahore_records.columns:
                 cases = pd.to_numeric(lahore_records['NO OF CASES'], errors='coerce')
                 valid_cases = cases.dropna()
                 
                 if len(valid_cases) != len(cases):
-                    validation['issues'].append("Invalid case count values")
-                    validation['quality_score'] -= 10
+                    validation.add_issue("Invalid case count values", 10)
                 
                 if not valid_cases.empty:
-                    validation['lahore_specific']['total_cases'] = int(valid_cases.sum())
+                    validation.details['total_cases'] = int(valid_cases.sum())
                     
                     if (valid_cases < 0).any():
-                        validation['issues'].append("Negative case counts found")
-                        validation['quality_score'] -= 15
+                        validation.add_issue("Negative case counts found", 15)
         
-        return validation
+        return validation.to_dict()
     
     def validate_healthcare_data(self, df: pd.DataFrame) -> Dict:
         """Validate healthcare infrastructure data quality"""
-        validation = {
-            'data_type': 'healthcare',
-            'total_records': len(df),
-            'issues': [],
-            'quality_score': 100,
-            'trends': {}
-        }
+        validation = ValidationResult('healthcare', len(df), 'trends')
         
-        missing_cols = [col for col in self.schemas['healthcare'] if col not in df.columns]
+        missing_cols = self._missing_columns('healthcare', df)
         if missing_cols:
-            validation['issues'].append(f"Missing columns: {missing_cols}")
-            validation['quality_score'] -= 20
+            validation.add_issue(f"Missing columns: {missing_cols}", 20)
         
         if 'Year' in df.columns:
             years = sorted(df['Year'].unique())
-            validation['trends']['year_range'] = f"{min(years)}-{max(years)}"
+            validation.details['year_range'] = f"{min(years)}-{max(years)}"
             
             expected_years = list(range(min(years), max(years) + 1))
             missing_years = set(expected_years) - set(years)
             if missing_years:
-                validation['issues'].append(f"Missing years: {sorted(missing_years)}")
-                validation['quality_score'] -= 10
+                validation.add_issue(f"Missing years: {sorted(missing_years)}", 10)
+        
+        numeric_cols = [col for col in ['Hospitals', 'Dispensaries', 'Total Beds'] if col in df.columns]
+        numeric_frame = self._clean_numeric_frame(df[numeric_cols])
+        null_counts = numeric_frame.isna().sum(axis=0)
         
-        numeric_cols = ['Hospitals', 'Dispensaries', 'Total Beds']
         for col in numeric_cols:
-            if col in df.columns:
-                cleaned = df[col].astype(str).str.replace(',', '').str.replace('nan', '0')
-                numeric_values = pd.to_numeric(cleaned, errors='coerce')
-                
-                null_count = numeric_values.isnull().sum()
-                if null_count > 0:
-                    validation['issues'].append(f"Invalid values in {col}: {null_count}")
-                    validation['quality_score'] -= 5
+            numeric_values = numeric_frame[col]
+            
+            null_count = null_counts[col]
+            if null_count > 0:
+                validation.add_issue(f"Invalid values in {col}: {null_count}", 5)
+            
+            if len(numeric_values) > 1:
+                trend = numeric_values.iloc[-1] - numeric_values.iloc[0]
+                validation.details[col] = {
+                    'start_value': int(numeric_values.iloc[0]),
+                    'end_value': int(numeric_values.iloc[-1]),
+                    'change': int(trend)
+                }
                 
-                if len(numeric_values) > 1:
-                    trend = numeric_values.iloc[-1] - numeric_values.iloc[0]
-                    validation['trends'][col] = {
-                        'start_value': int(numeric_values.iloc[0]),
-                        'end_value': int(numeric_values.iloc[-1]),
-                        'change': int(trend)
-                    }
-                    
-                    if trend < 0:
-                        validation['issues'].append(f"{col} shows negative trend")
-                        validation['quality_score'] -= 5
+                if trend < 0:
+                    validation.add_issue(f"{col} shows negative trend", 5)
         
-        return validation
+        return validation.to_dict()
     
     def validate_synthetic_energy(self, df: pd.DataFrame) -> Dict:
         """Validate synthetic energy data quality"""
-        validation = {
-            'data_type': 'energy',
-            'total_records': len(df),
-            'issues': [],
-            'quality_score': 100,
-            'patterns': {}
-        }
+        validation = ValidationResult('energy', len(df), 'patterns')
         
-        missing_cols = [col for col in self.schemas['energy'] if col not in df.columns]
+        missing_cols = self._missing_columns('energy', df)
         if missing_cols:
-            validation['issues'].append(f"Missing columns: {missing_cols}")
-            validation['quality_score'] -= 20
+            validation.add_issue(f"Missing columns: {missing_cols}", 20)
         
         if 'timestamp' in df.columns:
             try:
-                timestamps = pd.to_datetime(df['timestamp'])
-                validation['patterns']['time_range'] = f"{timestamps.min()} to {timestamps.max()}"
+                timestamps = self._parse_timestamps(df)
+                validation.details['time_range'] = f"{timestamps.min()} to {timestamps.max()}"
                 
                 duplicates = timestamps.duplicated().sum()
                 if duplicates > 0:
-                    validation['issues'].append(f"Duplicate timestamps: {duplicates}")
-                    validation['quality_score'] -= 10
+                    validation.add_issue(f"Duplicate timestamps: {duplicates}", 10)
                 
-                time_diff = timestamps.diff().dropna()
-                expected_freq = timedelta(hours=1)
-                irregular_intervals = (time_diff != expected_freq).sum()
+                # Step check on the raw int64 nanoseconds; steps touching NaT are ignored
+                ts_values = timestamps.to_numpy(dtype='datetime64[ns]')
+                irregular = np.diff(ts_values.view('i8')) != _HOUR_NS
+                missing = np.isnat(ts_values)
+                if missing.any():
+                    irregular &= ~(missing[1:] | missing[:-1])
+                irregular_intervals = int(np.count_nonzero(irregular))
                 if irregular_intervals > 0:
-                    validation['issues'].append(f"Irregular time intervals: {irregular_intervals}")
-                    validation['quality_score'] -= 5
+                    validation.add_issue(f"Irregular time intervals: {irregular_intervals}", 5)
                     
             except Exception as e:
-                validation['issues'].append(f"Timestamp parsing error: {str(e)}")
-                validation['quality_score'] -= 15
+                validation.add_issue(f"Timestamp parsing error: {str(e)}", 15)
+        
+        energy_cols = [col for col in ['total_consumption_mw', 'residential_mw', 'commercial_mw', 'industrial_mw']
+                       if col in df.columns]
+        values = df[energy_cols].apply(pd.to_numeric, errors='coerce')
+        
+        # Each check counts failures for every column in a single pass
+        check_counts = [(label, penalty, count_failures(values))
+                        for label, penalty, count_failures in self.value_checks['energy']]
+        
+        # One float64 reduction per column for all four statistics, rounded to the
+        # MW export precision so float32 storage noise stays out of the report
+        stats = {}
+        if energy_cols:
+            stats = values.astype(np.float64).agg(['min', 'max', 'mean', 'std']).round(STAT_DECIMALS).to_dict()
         
-        energy_cols = ['total_consumption_mw', 'residential_mw', 'commercial_mw', 'industrial_mw']
         for col in energy_cols:
-            if col in df.columns:
-                values = pd.to_numeric(df[col], errors='coerce')
-                
-                null_count = values.isnull().sum()
-                if null_count > 0:
-                    validation['issues'].append(f"Null values in {col}: {null_count}")
-                    validation['quality_score'] -= 5
-                
-                negative_count = (values < 0).sum()
-                if negative_count > 0:
-                    validation['issues'].append(f"Negative values in {col}: {negative_count}")
-                    validation['quality_score'] -= 10
-                
-                validation['patterns'][col] = {
-                    'min': float(values.min()),
-                    'max': float(values.max()),
-                    'mean': float(values.mean()),
-                    'std': float(values.std())
-                }
+            for label, penalty, counts in check_counts:
+                if counts[col] > 0:
+                    validation.add_issue(f"{label} in {col}: {counts[col]}", penalty)
+            
+            validation.details[col] = {stat: float(value) for stat, value in stats[col].items()}
         
-        return validation
+        return validation.to_dict()
     
     def validate_synthetic_emergency(self, df: pd.DataFrame) -> Dict:
         """Validate synthetic emergency data quality"""
-        validation = {
-            'data_type': 'emergency',
-            'total_records': len(df),
-            'issues': [],
-            'quality_score': 100,
-            'distribution': {}
-        }
+        validation = ValidationResult('emergency', len(df), 'distribution')
         
-        missing_cols = [col for col in self.schemas['emergency'] if col not in df.columns]
+        missing_cols = self._missing_columns('emergency', df)
         if missing_cols:
-            validation['issues'].append(f"Missing columns: {missing_cols}")
-            validation['quality_score'] -= 20
+            validation.add_issue(f"Missing columns: {missing_cols}", 20)
         
         if 'request_id' in df.columns:
-            duplicate_ids = df['request_id'].duplicated().sum()
+            duplicate_ids = len(df) - df['request_id'].nunique(dropna=False)
             if duplicate_ids > 0:
-                validation['issues'].append(f"Duplicate request IDs: {duplicate_ids}")
-                validation['quality_score'] -= 15
+                validation.add_issue(f"Duplicate request IDs: {duplicate_ids}", 15)
         
         categorical_cols = ['service_type', 'priority', 'status']
         for col in categorical_cols:
             if col in df.columns:
-                unique_values = df[col].unique()
-                validation['distribution'][col] = list(unique_values)
+                if isinstance(df[col].dtype, pd.CategoricalDtype):
+                    # Categories already hold the distinct labels; no hashing pass needed
+                    validation.details[col] = df[col].cat.categories.tolist()
+                else:
+                    validation.details[col] = list(df[col].unique())
                 
                 null_count = df[col].isnull().sum()
                 if null_count > 0:
-                    validation['issues'].append(f"Null values in {col}: {null_count}")
-                    validation['quality_score'] -= 5
+                    validation.add_issue(f"Null values in {col}: {null_count}", 5)
         
         if 'latitude' in df.columns and 'longitude' in df.columns:
             lat_values = pd.to_numeric(df['latitude'], errors='coerce')
@@ -278,16 +334,14 @@ class SmartCityDataValidator:
             lahore_lat_bounds = (31.3, 31.8)
             lahore_lon_bounds = (74.0, 74.7)
             
-            out_of_bounds = ((lat_values < lahore_lat_bounds[0]) | 
-                           (lat_values > lahore_lat_bounds[1]) |
-                           (lon_values < lahore_lon_bounds[0]) | 
-                           (lon_values > lahore_lon_bounds[1])).sum()
+            out_of_bounds = _count_out_of_bounds(lat_values.to_numpy(dtype=float),
+                                                 lon_values.to_numpy(dtype=float),
+                                                 lahore_lat_bounds, lahore_lon_bounds)
             
             if out_of_bounds > 0:
-                validation['issues'].append(f"Coordinates outside Lahore bounds: {out_of_bounds}")
-                validation['quality_score'] -= 5
+                validation.add_issue(f"Coordinates outside Lahore bounds: {out_of_bounds}", 5)
         
-        return validation
+        return validation.to_dict()
     
     def run_comprehensive_validation(self, datasets: Dict) -> Dict:
         """Run complete validation pipeline on all datasets"""
@@ -298,26 +352,30 @@ class SmartCityDataValidator:
             'summary': {}
         }
         
-        dataset_mapping = {
-            'traffic_vehicles': 'validate_vehicle_data',
-            'traffic_accidents': 'validate_accident_data', 
-            'healthcare': 'validate_healthcare_data',
-            'energy': 'validate_synthetic_energy',
-            'emergency': 'validate_synthetic_emergency'
-        }
+        tasks = []
+        for dataset_name, data in datasets.items():
+            validator_method = self._dispatch.get(dataset_name)
+            if validator_method is None or not isinstance(data, pd.DataFrame):
+                continue
+            tasks.append((dataset_name, validator_method, data))
+        
+        # Validators are independent and CPU-bound; below PARALLEL_MIN_ROWS the
+        # process start-up and pickling cost more than the validation itself
+        total_rows = sum(len(data) for _, _, data in tasks)
+        if len(tasks) > 1 and self.max_workers > 1 and total_rows >= PARALLEL_MIN_ROWS:
+            with ProcessPoolExecutor(max_workers=min(len(tasks), self.max_workers)) as executor:
+                results = list(executor.map(_run_validator, tasks))
+        else:
+            results = [_run_validator(task) for task in tasks]
         
         total_datasets = 0
         total_quality = 0
         
-        for dataset_name, data in datasets.items():
-            if data is not None and isinstance(data, pd.DataFrame):
-                if dataset_name in dataset_mapping:
-                    validator_method = getattr(self, dataset_mapping[dataset_name])
-                    result = validator_method(data)
-                    validation_results['dataset_validations'][dataset_name] = result
-                    
-                    total_datasets += 1
-                    total_quality += result['quality_score']
+        for dataset_name, result in results:
+            validation_results['dataset_validations'][dataset_name] = result
+            
+            total_datasets += 1
+            total_quality += result['quality_score']
         
         if total_datasets > 0:
             validation_results['overall_quality'] = total_quality / total_datasets
@@ -325,7 +383,7 @@ class SmartCityDataValidator:
         validation_results['summary'] = {
             'datasets_validated': total_datasets,
             'average_quality_score': validation_results['overall_quality'],
-            'total_issues': sum(len(v['issues']) for v in validation_results['dataset_validations'].values()),
+            'total_issues': sum(v['issue_count'] for v in validation_results['dataset_validations'].values()),
             'quality_status': self._get_quality_status(validation_results['overall_quality'])
         }
         
@@ -333,11 +391,4 @@ class SmartCityDataValidator:
     
     def _get_quality_status(self, score: float) -> str:
         """Determine quality status based on score"""
-        if score >= 90:
-            return "Excellent"
-        elif score >= 80:
-            return "Good" 
-        elif score >= 70:
-            return "Fair"
-        else:
-            return "Poor"
\ No newline at end of file
+        return _QUALITY_STATUSES[bisect_right(_QUALITY_THRESHOLDS, score)]
\ No newline at end of file
@@ -3,14 +3,37 @@
 
 import pandas as pd
 import numpy as np
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from typing import Dict, Optional
 
 from data_collection import LahoreDataCollector
 from synthetic_generators import LahoreSyntheticGenerator  
 from data_validation import SmartCityDataValidator
+from utils import FileUtils
+
+# Low-cardinality text columns stored as category codes once they enter the pipeline
+CATEGORICAL_COLUMNS = {
+    'traffic_vehicles': ['Division/ District'],
+    'traffic_accidents': ['PROVINCE', 'DISTRICT', 'ACCIDENT/CAUSALITIES'],
+    'emergency': ['service_type', 'priority', 'status', 'district']
+}
+
+# Display precision for synthetic columns, applied once when the CSVs are written
+EXPORT_DECIMALS = {
+    'energy': {'total_consumption_mw': 2, 'residential_mw': 2, 'commercial_mw': 2,
+               'industrial_mw': 2, 'grid_frequency_hz': 2, 'voltage_kv': 1},
+    'emergency': {'latitude': 6, 'longitude': 6}
+}
+
+def _to_categorical(dataset_name: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Cast the dataset's known low-cardinality columns to category dtype in place"""
+    for col in CATEGORICAL_COLUMNS.get(dataset_name, []):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
 
 class Day1Pipeline:
     """Complete Day 1 pipeline for Lahore Smart City"""
@@ -47,6 +70,9 @@ class Day1Pipeline:
         if collection_results['weather'] is not None:
             self.results['weather_data'] = collection_results['weather']
         
+        for dataset_name, df in datasets.items():
+            _to_categorical(dataset_name, df)
+        
         self.results['collected_data'] = datasets
         self.results['collection_status'] = collection_results['status']
         
@@ -57,7 +83,7 @@ class Day1Pipeline:
         
         if vehicle_count is None and 'traffic_vehicles' in self.results['collected_data']:
             vehicles_df = self.results['collected_data']['traffic_vehicles']
-            vehicle_count = int(vehicles_df['Total'].sum())
+            vehicle_count = int(vehicles_df['Total'].to_numpy().sum())
         elif vehicle_count is None:
             vehicle_count = 6663603
         
@@ -65,7 +91,7 @@ class Day1Pipeline:
         
         self.results['synthetic_data'] = {
             'energy': synthetic_results['energy'],
-            'emergency': synthetic_results['emergency']
+            'emergency': _to_categorical('emergency', synthetic_results['emergency'])
         }
         self.results['generation_parameters'] = synthetic_results['parameters']
         
@@ -86,35 +112,41 @@ class Day1Pipeline:
     def export_datasets(self, output_dir: str = "data/processed") -> Dict:
         """Export all datasets to files for Day 2 processing"""
         
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
         
-        export_paths = {}
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # (export key, file path, writer) for every file of this run
+        writes = []
+        
         for dataset_name, df in self.results['collected_data'].items():
             if df is not None:
                 file_path = os.path.join(output_dir, f"{dataset_name}_{timestamp}.csv")
-                df.to_csv(file_path, index=False)
-                export_paths[dataset_name] = file_path
+                writes.append((dataset_name, file_path, partial(df.to_csv, file_path, index=False)))
         
         for dataset_name, df in self.results['synthetic_data'].items():
             if df is not None:
                 file_path = os.path.join(output_dir, f"synthetic_{dataset_name}_{timestamp}.csv")
-                df.to_csv(file_path, index=False)
-                export_paths[f"synthetic_{dataset_name}"] = file_path
+                export_df = df.round(EXPORT_DECIMALS.get(dataset_name, {}))
+                writes.append((f"synthetic_{dataset_name}", file_path, partial(export_df.to_csv, file_path, index=False)))
         
         if 'weather_data' in self.results:
             weather_path = os.path.join(output_dir, f"weather_data_{timestamp}.json")
-            with open(weather_path, 'w') as f:
-                json.dump(self.results['weather_data'], f, indent=2)
-            export_paths['weather'] = weather_path
+            writes.append(('weather', weather_path, partial(FileUtils.save_json, self.results['weather_data'], weather_path)))
         
         validation_path = os.path.join(output_dir, f"validation_results_{timestamp}.json")
-        with open(validation_path, 'w') as f:
-            json.dump(self.results['validation_results'], f, indent=2)
-        export_paths['validation'] = validation_path
-        
+        writes.append(('validation', validation_path,
+                       partial(FileUtils.save_json, self.results['validation_results'], validation_path)))
+        
+        # Files are independent, so their writes overlap on a thread pool
+        with ThreadPoolExecutor(max_workers=min(8, len(writes))) as executor:
+            futures = [executor.submit(write) for _, _, write in writes]
+            for (_, file_path, _), future in zip(writes, futures):
+                # save_json reports failure by returning False rather than raising
+                if future.result() is False:
+                    raise IOError(f"Could not write {file_path}")
+        
+        export_paths = {key: file_path for key, file_path, _ in writes}
         self.results['export_paths'] = export_paths
         return export_paths
     
@@ -148,23 +180,21 @@ class Day1Pipeline:
         
         if 'traffic_vehicles' in self.results['collected_data']:
             vehicles_df = self.results['collected_data']['traffic_vehicles']
-            total_vehicles = int(vehicles_df['Total'].sum())
+            total_vehicles = int(vehicles_df['Total'].to_numpy().sum())
             summary['lahore_insights']['total_vehicles'] = total_vehicles
             
-            vehicle_types = {}
-            for col in vehicles_df.columns:
-                if col != 'Division/ District' and col != 'Total':
-                    count = int(vehicles_df[col].sum())
-                    if count > 0:
-                        vehicle_types[col] = count
-            summary['lahore_insights']['vehicle_distribution'] = vehicle_types
+            type_sums = vehicles_df.drop(columns=['Division/ District', 'Total'], errors='ignore').sum(numeric_only=True)
+            summary['lahore_insights']['vehicle_distribution'] = {
+                col: int(count) for col, count in type_sums.items() if count > 0
+            }
         
         if 'traffic_accidents' in self.results['collected_data']:
             accidents_df = self.results['collected_data']['traffic_accidents']
             summary['lahore_insights']['accident_records'] = len(accidents_df)
             
-            years = accidents_df['YEAR '].unique()
-            summary['lahore_insights']['accident_year_range'] = f"{min(years)}-{max(years)}"
+            years = pd.to_numeric(accidents_df['YEAR'], errors='coerce').dropna().to_numpy()
+            if years.size:
+                summary['lahore_insights']['accident_year_range'] = f"{int(years.min())}-{int(years.max())}"
         
         required_components = ['traffic_vehicles', 'traffic_accidents', 'energy', 'emergency']
         available_components = list(self.results['collected_data'].keys()) + \
@@ -229,8 +259,8 @@ if __name__ == "__main__":
         print(f"Datasets: {len(results['datasets']['collected'])} real, {len(results['datasets']['synthetic'])} synthetic")
         print(f"Export Files: {len(results['export_files'])}")
         
-        with open("day1_summary.json", 'w') as f:
-            json.dump(results, f, indent=2)
+        if not FileUtils.save_json(results, "day1_summary.json"):
+            raise IOError("Could not write day1_summary.json")
         
         print("Summary saved to day1_summary.json")
         
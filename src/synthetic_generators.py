@@ -7,187 +7,173 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import random
 
+class _CDFSampler:
+    """Categorical sampler that inverts a precomputed CDF with searchsorted"""
+    
+    def __init__(self, p, values=None):
+        cdf = np.cumsum(p, dtype=float)
+        self.cdf = cdf / cdf[-1]
+        self.values = np.arange(len(self.cdf)) if values is None else np.asarray(values)
+    
+    def sample(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """Draw n values using rng.random for the uniforms"""
+        return self.values[np.searchsorted(self.cdf, rng.random(n), side='right')]
+
 class LahoreSyntheticGenerator:
     """Generate synthetic data for missing smart city components"""
     
+    # Energy demand factors: hour of day (night low, morning and evening peaks),
+    # weekday (weekends run lower) and month (index 0 unused; summer and winter highs)
+    _HOUR_FACTORS = np.array([0.6] * 6 + [1.3] * 4 + [1.0] * 8 + [1.4] * 5 + [1.0], dtype=np.float32)
+    _DAY_FACTORS = np.array([1.0] * 5 + [0.85] * 2, dtype=np.float32)
+    _SEASONAL_FACTORS = np.array([1.0, 1.2, 1.2, 1.0, 1.0, 1.6, 1.6, 1.6, 1.6, 1.0, 1.0, 1.0, 1.2],
+                                 dtype=np.float32)
+    
+    # Fixed probability distribution for request hours, normalized once
+    _HOUR_PROBS = np.array([
+        0.02, 0.01, 0.01, 0.01, 0.02, 0.03,
+        0.05, 0.08, 0.10, 0.09, 0.08, 0.07,
+        0.06, 0.07, 0.08, 0.09, 0.10, 0.11,
+        0.09, 0.07, 0.05, 0.04, 0.03, 0.02
+    ])
+    _HOUR_PROBS /= _HOUR_PROBS.sum()
+    
+    # Fixed probability distribution for service types, in service_types order
+    _SERVICE_PROBS = np.array([0.15, 0.12, 0.10, 0.08, 0.07, 0.08,
+                               0.06, 0.05, 0.04, 0.06, 0.09, 0.10])
+    _SERVICE_PROBS /= _SERVICE_PROBS.sum()
+    
+    # Base resolution hours per service type (same order) and the scaling
+    # for each priority in ['High', 'Medium', 'Low']
+    _BASE_RESOLUTION_HOURS = np.array([6, 72, 24, 8, 48, 24, 24, 4, 12, 12, 48, 1], dtype=np.int32)
+    _PRIORITY_TIME_FACTORS = np.array([0.5, 1.0, 1.5])
+    
+    # Index samplers; priorities index ['High', 'Medium', 'Low'] and statuses
+    # index ['Open', 'In Progress', 'Closed', 'Pending']
+    _HOUR_SAMPLER = _CDFSampler(_HOUR_PROBS)
+    _SERVICE_SAMPLER = _CDFSampler(_SERVICE_PROBS)
+    _MOSTLY_HIGH_PRIORITY_SAMPLER = _CDFSampler([0.7, 0.3])
+    _PRIORITY_SAMPLER = _CDFSampler([0.1, 0.4, 0.5])
+    _OLD_STATUS_SAMPLER = _CDFSampler([0.1, 0.1, 0.7, 0.1])
+    _AGING_STATUS_SAMPLER = _CDFSampler([0.2, 0.3, 0.4, 0.1])
+    _RECENT_STATUS_SAMPLER = _CDFSampler([0.4, 0.4, 0.1, 0.1])
+    
     def __init__(self, base_population: int = 13000000):
         self.base_population = base_population
         self.random_seed = 42
-        np.random.seed(self.random_seed)
+        self.rng = np.random.default_rng(self.random_seed)
         random.seed(self.random_seed)
     
     def generate_energy_data(self, vehicle_count: int = 6663603) -> pd.DataFrame:
         """Generate synthetic energy consumption data for Lahore"""
         end_date = datetime.now()
         start_date = end_date - timedelta(days=30)
-        date_range = pd.date_range(start=start_date, end=end_date, freq='H')
-        
-        energy_data = []
-        
-        for timestamp in date_range:
-            hour = timestamp.hour
-            day_of_week = timestamp.weekday()
-            
-            # Base consumption (MW) scaled by vehicle density
-            base_consumption = (vehicle_count / 1000000) * 450
-            
-            # Hour-of-day pattern
-            if 6 <= hour <= 9:  # Morning peak
-                hour_factor = 1.3
-            elif 18 <= hour <= 22:  # Evening peak  
-                hour_factor = 1.4
-            elif 0 <= hour <= 5:  # Night low
-                hour_factor = 0.6
-            else:
-                hour_factor = 1.0
-            
-            # Day-of-week pattern
-            if day_of_week < 5:  # Weekdays
-                day_factor = 1.0
-            else:  # Weekend
-                day_factor = 0.85
-            
-            # Seasonal factor
-            month = timestamp.month
-            if month in [5, 6, 7, 8]:  # Summer
-                seasonal_factor = 1.6
-            elif month in [12, 1, 2]:  # Winter
-                seasonal_factor = 1.2
-            else:
-                seasonal_factor = 1.0
-            
-            # Random variation
-            noise = np.random.normal(1.0, 0.05)
-            
-            consumption = base_consumption * hour_factor * day_factor * seasonal_factor * noise
-            
-            energy_data.append({
-                'timestamp': timestamp,
-                'total_consumption_mw': round(consumption, 2),
-                'residential_mw': round(consumption * 0.45, 2),
-                'commercial_mw': round(consumption * 0.35, 2), 
-                'industrial_mw': round(consumption * 0.20, 2),
-                'grid_frequency_hz': round(50.0 + np.random.normal(0, 0.1), 2),
-                'voltage_kv': round(132 + np.random.normal(0, 2), 1)
-            })
-        
-        return pd.DataFrame(energy_data)
+        date_range = pd.date_range(start=start_date, end=end_date, freq='h')
+        n = len(date_range)
+        
+        hours = date_range.hour.to_numpy()
+        days_of_week = date_range.weekday.to_numpy()
+        months = date_range.month.to_numpy()
+        
+        # Base consumption (MW) scaled by vehicle density
+        base_consumption = (vehicle_count / 1000000) * 450
+        
+        # Branch-free factor lookups by hour, weekday and month
+        hour_factor = self._HOUR_FACTORS[hours]
+        day_factor = self._DAY_FACTORS[days_of_week]
+        seasonal_factor = self._SEASONAL_FACTORS[months]
+        
+        # Random variation
+        noise = self.rng.normal(1.0, 0.05, n)
+        
+        # float32 is ample for MW and kV readings and halves the column size
+        consumption = (base_consumption * hour_factor * day_factor * seasonal_factor * noise).astype(np.float32)
+        grid_frequency = (50.0 + self.rng.normal(0, 0.1, n)).astype(np.float32)
+        voltage = (132 + self.rng.normal(0, 2, n)).astype(np.float32)
+        
+        return pd.DataFrame({
+            'timestamp': date_range,
+            'total_consumption_mw': consumption,
+            'residential_mw': consumption * np.float32(0.45),
+            'commercial_mw': consumption * np.float32(0.35),
+            'industrial_mw': consumption * np.float32(0.20),
+            'grid_frequency_hz': grid_frequency,
+            'voltage_kv': voltage
+        }, copy=False)
     
     def generate_emergency_data(self, accident_data: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """Generate synthetic emergency/311 service requests for Lahore"""
         end_date = datetime.now()
         start_date = end_date - timedelta(days=90)
         
-        emergency_data = []
-        
-        service_types = [
+        service_types = np.array([
             'Traffic Signal Malfunction', 'Road Damage/Pothole', 'Street Light Out',
             'Water Main Break', 'Noise Complaint', 'Garbage Collection',
             'Tree Down/Damage', 'Electrical Hazard', 'Animal Control',
             'Public Health Concern', 'Infrastructure Damage', 'Emergency Response'
-        ]
+        ])
         
-        priorities = ['High', 'Medium', 'Low']
-        statuses = ['Open', 'In Progress', 'Closed', 'Pending']
+        priorities = np.array(['High', 'Medium', 'Low'])
+        statuses = np.array(['Open', 'In Progress', 'Closed', 'Pending'])
+        districts = np.array(['Lahore City', 'Lahore Cantonment', 'Model Town', 'Gulberg', 'DHA'])
         
         daily_requests = int((6663603 / 1000000) * 150)
         
-        current_date = start_date
-        request_id = 1000000
-        
-        while current_date <= end_date:
-            day_requests = daily_requests + np.random.poisson(50)
-            
-            for _ in range(day_requests):
-                # Fixed probability distribution for hours
-                hour_probs = np.array([
-                    0.02, 0.01, 0.01, 0.01, 0.02, 0.03,
-                    0.05, 0.08, 0.10, 0.09, 0.08, 0.07,
-                    0.06, 0.07, 0.08, 0.09, 0.10, 0.11,
-                    0.09, 0.07, 0.05, 0.04, 0.03, 0.02
-                ])
-                # Normalize to ensure sum = 1.0
-                hour_probs = hour_probs / hour_probs.sum()
-                
-                hour = np.random.choice(range(24), p=hour_probs)
-                
-                timestamp = current_date.replace(
-                    hour=hour, 
-                    minute=np.random.randint(0, 60),
-                    second=np.random.randint(0, 60)
-                )
-                
-                # Fixed probability distribution for service types
-                service_probs = np.array([0.15, 0.12, 0.10, 0.08, 0.07, 0.08, 
-                                        0.06, 0.05, 0.04, 0.06, 0.09, 0.10])
-                # Normalize to ensure sum = 1.0
-                service_probs = service_probs / service_probs.sum()
-                
-                service_type = np.random.choice(service_types, p=service_probs)
-                
-                if service_type in ['Emergency Response', 'Electrical Hazard', 'Water Main Break']:
-                    priority = 'High'
-                elif service_type in ['Traffic Signal Malfunction', 'Public Health Concern']:
-                    priority = np.random.choice(['High', 'Medium'], p=[0.7, 0.3])
-                else:
-                    priority = np.random.choice(priorities, p=[0.1, 0.4, 0.5])
-                
-                days_old = (end_date - timestamp).days
-                if days_old > 30:
-                    status = np.random.choice(statuses, p=[0.1, 0.1, 0.7, 0.1])
-                elif days_old > 7:
-                    status = np.random.choice(statuses, p=[0.2, 0.3, 0.4, 0.1])
-                else:
-                    status = np.random.choice(statuses, p=[0.4, 0.4, 0.1, 0.1])
-                
-                lat = 31.5497 + np.random.normal(0, 0.1)
-                lon = 74.3436 + np.random.normal(0, 0.1)
-                
-                emergency_data.append({
-                    'request_id': f"LHR{request_id}",
-                    'timestamp': timestamp,
-                    'service_type': service_type,
-                    'priority': priority,
-                    'status': status,
-                    'latitude': round(lat, 6),
-                    'longitude': round(lon, 6),
-                    'district': np.random.choice(['Lahore City', 'Lahore Cantonment', 
-                                                'Model Town', 'Gulberg', 'DHA']),
-                    'description': f"Service request for {service_type.lower()}",
-                    'estimated_resolution_hours': self._get_resolution_time(service_type, priority)
-                })
-                
-                request_id += 1
-            
-            current_date += timedelta(days=1)
-        
-        return pd.DataFrame(emergency_data)
-    
-    def _get_resolution_time(self, service_type: str, priority: str) -> int:
-        """Estimate resolution time based on service type and priority"""
-        base_times = {
-            'Emergency Response': 1,
-            'Electrical Hazard': 4,
-            'Water Main Break': 8,
-            'Traffic Signal Malfunction': 6,
-            'Street Light Out': 24,
-            'Road Damage/Pothole': 72,
-            'Public Health Concern': 12,
-            'Infrastructure Damage': 48,
-            'Tree Down/Damage': 24,
-            'Noise Complaint': 48,
-            'Garbage Collection': 24,
-            'Animal Control': 12
-        }
-        
-        base_time = base_times.get(service_type, 24)
-        
-        if priority == 'High':
-            return max(1, int(base_time * 0.5))
-        elif priority == 'Medium':
-            return base_time
-        else:
-            return int(base_time * 1.5)
+        # Request count for every day in the window, then one row per request
+        n_days = (end_date - start_date).days + 1
+        daily_counts = daily_requests + self.rng.poisson(50, n_days)
+        total = int(daily_counts.sum())
+        day_index = np.repeat(np.arange(n_days), daily_counts)
+        
+        hours = self._HOUR_SAMPLER.sample(total, self.rng)
+        minutes = self.rng.integers(0, 60, total)
+        seconds = self.rng.integers(0, 60, total)
+        
+        # Plain datetime64[ns] arithmetic; no per-row datetime objects
+        day_starts = np.datetime64(start_date.date(), 'ns') + day_index * np.timedelta64(1, 'D')
+        timestamps = (day_starts + hours * np.timedelta64(1, 'h')
+                      + minutes * np.timedelta64(1, 'm') + seconds * np.timedelta64(1, 's'))
+        
+        service_idx = self._SERVICE_SAMPLER.sample(total, self.rng)
+        service_type = service_types[service_idx]
+        
+        # Priority index into `priorities`; critical services are always High
+        always_high = np.isin(service_type, ['Emergency Response', 'Electrical Hazard', 'Water Main Break'])
+        mostly_high = np.isin(service_type, ['Traffic Signal Malfunction', 'Public Health Concern'])
+        priority_idx = np.select(
+            [always_high, mostly_high],
+            [0, self._MOSTLY_HIGH_PRIORITY_SAMPLER.sample(total, self.rng)],
+            self._PRIORITY_SAMPLER.sample(total, self.rng)
+        )
+        
+        # Older requests are more likely to be closed
+        days_old = (np.datetime64(end_date, 'ns') - timestamps) // np.timedelta64(1, 'D')
+        status_idx = np.select(
+            [days_old > 30, days_old > 7],
+            [self._OLD_STATUS_SAMPLER.sample(total, self.rng),
+             self._AGING_STATUS_SAMPLER.sample(total, self.rng)],
+            self._RECENT_STATUS_SAMPLER.sample(total, self.rng)
+        )
+        
+        lat = 31.5497 + self.rng.normal(0, 0.1, total)
+        lon = 74.3436 + self.rng.normal(0, 0.1, total)
+        
+        resolution_hours = np.maximum(1, (self._BASE_RESOLUTION_HOURS[service_idx]
+                                          * self._PRIORITY_TIME_FACTORS[priority_idx]).astype(np.int32))
+        descriptions = np.array([f"Service request for {service.lower()}" for service in service_types])
+        
+        return pd.DataFrame({
+            'request_id': 'LHR' + np.arange(1000000, 1000000 + total).astype(str).astype(object),
+            'timestamp': timestamps,
+            'service_type': service_type,
+            'priority': priorities[priority_idx],
+            'status': statuses[status_idx],
+            'latitude': lat,
+            'longitude': lon,
+            'district': districts[self.rng.integers(0, len(districts), total)],
+            'description': descriptions[service_idx],
+            'estimated_resolution_hours': resolution_hours
+        }, copy=False)
     
     def generate_all_synthetic_data(self, vehicle_count: int = 6663603) -> Dict:
         """Generate all synthetic data components"""
@@ -4,26 +4,86 @@
 import pandas as pd
 import numpy as np
 import os
+import sys
 import json
+import math
+import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union, Tuple
 
+try:
+    import orjson
+except ImportError:  # fall back to the standard library json module
+    orjson = None
+
+# One lookahead per category, tried in priority order, so the first category
+# whose keyword appears anywhere in the description wins
+_WEATHER_RE = re.compile(
+    r'^(?=.*(rain|drizzle|shower))|^(?=.*(cloud|overcast))|^(?=.*(clear|sunny))'
+    r'|^(?=.*(mist|fog|haze))|^(?=.*(storm|thunder))',
+    re.IGNORECASE | re.DOTALL
+)
+_WEATHER_CATEGORIES = ("Rainy", "Cloudy", "Clear", "Misty", "Stormy")
+
+# Air quality description indexed by AQI (1-5); index 0 covers anything else
+_AQI_DESCRIPTIONS = ("Unknown", "Good", "Fair", "Moderate", "Poor", "Very Poor")
+_AQI_LEVELS = (1, 2, 3, 4, 5)
+
+def _json_default(obj):
+    """Fallback encoder shared by both JSON writers; float subclasses stay numbers"""
+    return float(obj) if isinstance(obj, float) else str(obj)
+
+def _finite_or_none(obj):
+    """Replace NaN/inf with None (null), as orjson writes them"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite_or_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_none(value) for value in obj]
+    return obj
+
+class DataFrameStats:
+    """Null counts, shape, dtypes and shallow memory of a DataFrame from one isna pass"""
+    
+    def __init__(self, df: pd.DataFrame):
+        self.total_rows, self.total_columns = df.shape
+        self.null_per_col = np.count_nonzero(df.isna().to_numpy(), axis=0)
+        self.null_counts = dict(zip(df.columns, self.null_per_col.tolist()))
+        self.total_null = int(self.null_per_col.sum())
+        self.total_cells = self.total_rows * self.total_columns
+        self.completeness_ratio = ((self.total_cells - self.total_null) / self.total_cells
+                                   if self.total_cells > 0 else 0)
+        self.dtypes = df.dtypes.astype(str).to_dict()
+        self.memory_bytes = int(df.memory_usage(deep=False).sum())
+
 class DataUtils:
     """Utility functions for data processing and manipulation"""
     
     @staticmethod
     def clean_numeric_column(series: pd.Series, default_value: float = 0) -> pd.Series:
         """Clean numeric column by removing commas and converting to numeric"""
-        cleaned = (series.astype(str)
-                  .str.replace(',', '')
-                  .str.replace('nan', str(default_value))
-                  .str.strip())
+        if pd.api.types.is_numeric_dtype(series):
+            return series.fillna(default_value)
+        
+        # Commas and whitespace go in one regex pass; 'nan' and other text coerce to NaN
+        cleaned = series.astype(str).str.replace(r'[,\s]', '', regex=True)
         return pd.to_numeric(cleaned, errors='coerce').fillna(default_value)
     
+    @staticmethod
+    def lahore_mask(districts: pd.Series) -> pd.Series:
+        """Row mask for Lahore districts, matched once per unique name via category codes"""
+        if not isinstance(districts.dtype, pd.CategoricalDtype):
+            districts = districts.astype('category')
+        matches = np.asarray(districts.cat.categories.str.contains('Lahore', case=False, na=False, regex=False),
+                             dtype=bool)
+        # Missing values have code -1, which picks up the trailing False
+        return pd.Series(np.append(matches, False)[districts.cat.codes.to_numpy()], index=districts.index)
+    
     @staticmethod
     def filter_lahore_data(df: pd.DataFrame, district_column: str) -> pd.DataFrame:
         """Filter DataFrame for Lahore-specific records"""
-        return df[df[district_column].str.contains('Lahore', case=False, na=False)].copy()
+        return df[DataUtils.lahore_mask(df[district_column])].copy()
     
     @staticmethod
     def calculate_percentage_change(start_value: float, end_value: float) -> float:
@@ -33,14 +93,17 @@ class DataUtils:
         return ((end_value - start_value) / start_value) * 100
     
     @staticmethod
-    def get_data_summary(df: pd.DataFrame) -> Dict:
+    def get_data_summary(df: pd.DataFrame, deep_memory: bool = False,
+                         stats: Optional[DataFrameStats] = None) -> Dict:
         """Generate summary statistics for DataFrame"""
+        stats = stats or DataFrameStats(df)
+        memory_bytes = DataUtils.estimate_memory_bytes(df, deep=True) if deep_memory else stats.memory_bytes
         summary = {
-            'total_rows': len(df),
-            'total_columns': len(df.columns),
-            'memory_usage_mb': round(df.memory_usage(deep=True).sum() / 1024 / 1024, 2),
-            'null_counts': df.isnull().sum().to_dict(),
-            'data_types': df.dtypes.astype(str).to_dict()
+            'total_rows': stats.total_rows,
+            'total_columns': stats.total_columns,
+            'memory_usage_mb': round(memory_bytes / 1024 / 1024, 2),
+            'null_counts': stats.null_counts,
+            'data_types': stats.dtypes
         }
         
         numeric_cols = df.select_dtypes(include=[np.number]).columns
@@ -49,14 +112,26 @@ class DataUtils:
         
         return summary
 
+    @staticmethod
+    def estimate_memory_bytes(df: pd.DataFrame, deep: bool = False, sample_size: int = 1000) -> int:
+        """Shallow memory usage, plus sampled object sizes when deep is set"""
+        total = int(df.memory_usage(deep=False).sum())
+        if deep:
+            # Scale the mean size of a sample instead of sizing every object
+            for col in df.select_dtypes(include=['object']).columns:
+                values = df[col]
+                if len(values) > 0:
+                    sample = values.sample(min(sample_size, len(values)), random_state=0)
+                    total += int(np.mean([sys.getsizeof(v) for v in sample]) * len(values))
+        return total
+
 class FileUtils:
     """Utility functions for file operations"""
     
     @staticmethod
     def ensure_directory(path: str) -> str:
         """Ensure directory exists, create if not"""
-        if not os.path.exists(path):
-            os.makedirs(path)
+        os.makedirs(path, exist_ok=True)
         return path
     
     @staticmethod
@@ -77,9 +152,20 @@ class FileUtils:
     def save_json(data: Dict, file_path: str, indent: int = 2) -> bool:
         """Save dictionary to JSON file"""
         try:
-            FileUtils.ensure_directory(os.path.dirname(file_path))
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=indent, default=str)
+            directory = os.path.dirname(file_path)
+            if directory:
+                FileUtils.ensure_directory(directory)
+            # Both writers produce the same text: datetimes and numpy scalars go
+            # through _json_default, non-finite floats become null, UTF-8 unescaped
+            if orjson is not None and indent == 2:
+                options = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                           | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(data, default=_json_default, option=options))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(_finite_or_none(data), f, indent=indent, default=_json_default,
+                              ensure_ascii=False)
             return True
         except Exception:
             return False
@@ -88,8 +174,8 @@ class FileUtils:
     def load_json(file_path: str) -> Optional[Dict]:
         """Load JSON file to dictionary"""
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read()) if orjson else json.load(f)
         except Exception:
             return None
 
@@ -104,36 +190,29 @@ class WeatherUtils:
     @staticmethod
     def get_air_quality_description(aqi: int) -> str:
         """Get air quality description from AQI value"""
-        if aqi == 1:
-            return "Good"
-        elif aqi == 2:
-            return "Fair" 
-        elif aqi == 3:
-            return "Moderate"
-        elif aqi == 4:
-            return "Poor"
-        elif aqi == 5:
-            return "Very Poor"
-        else:
-            return "Unknown"
+        # Membership compares with ==, so 2.0 still maps and None/NaN fall through
+        return _AQI_DESCRIPTIONS[int(aqi)] if aqi in _AQI_LEVELS else "Unknown"
+    
+    @staticmethod
+    def get_air_quality_description_series(aqi: np.ndarray) -> np.ndarray:
+        """Get air quality descriptions for an array of AQI values"""
+        aqi = np.asarray(aqi)
+        valid = np.isin(aqi, _AQI_LEVELS)
+        return np.take(_AQI_DESCRIPTIONS, np.where(valid, aqi, 0).astype(np.intp))
     
     @staticmethod
     def categorize_weather_condition(description: str) -> str:
         """Categorize weather condition for analysis"""
-        description_lower = description.lower()
-        
-        if any(word in description_lower for word in ['rain', 'drizzle', 'shower']):
-            return "Rainy"
-        elif any(word in description_lower for word in ['cloud', 'overcast']):
-            return "Cloudy"
-        elif any(word in description_lower for word in ['clear', 'sunny']):
-            return "Clear"
-        elif any(word in description_lower for word in ['mist', 'fog', 'haze']):
-            return "Misty"
-        elif any(word in description_lower for word in ['storm', 'thunder']):
-            return "Stormy"
-        else:
-            return "Other"
+        match = _WEATHER_RE.match(description)
+        return _WEATHER_CATEGORIES[match.lastindex - 1] if match else "Other"
+    
+    @staticmethod
+    def categorize_weather_series(descriptions: pd.Series) -> pd.Series:
+        """Categorize a whole Series of weather descriptions in one regex pass"""
+        groups = descriptions.str.extract(_WEATHER_RE)
+        categories = np.select([groups[i].notna().to_numpy() for i in groups.columns],
+                               _WEATHER_CATEGORIES, default="Other")
+        return pd.Series(categories, index=descriptions.index)
 
 class ValidationUtils:
     """Utility functions for data validation"""
@@ -149,15 +228,29 @@ class ValidationUtils:
                                  lat_bounds: Tuple[float, float], 
                                  lon_bounds: Tuple[float, float]) -> bool:
         """Validate if coordinates are within specified bounds"""
+        if isinstance(lat, (pd.Series, np.ndarray)):
+            return ValidationUtils.validate_coordinate_bounds_array(lat, lon, lat_bounds, lon_bounds)
         return (lat_bounds[0] <= lat <= lat_bounds[1] and 
                 lon_bounds[0] <= lon <= lon_bounds[1])
     
     @staticmethod
-    def check_data_completeness(df: pd.DataFrame, threshold: float = 0.95) -> Dict:
+    def validate_coordinate_bounds_array(lat: np.ndarray, lon: np.ndarray,
+                                         lat_bounds: Tuple[float, float],
+                                         lon_bounds: Tuple[float, float]) -> np.ndarray:
+        """Boolean mask of coordinates within the specified bounds"""
+        lat = np.asarray(lat)
+        lon = np.asarray(lon)
+        return ((lat >= lat_bounds[0]) & (lat <= lat_bounds[1]) &
+                (lon >= lon_bounds[0]) & (lon <= lon_bounds[1]))
+    
+    @staticmethod
+    def check_data_completeness(df: pd.DataFrame, threshold: float = 0.95,
+                                stats: Optional[DataFrameStats] = None) -> Dict:
         """Check data completeness against threshold"""
-        total_cells = len(df) * len(df.columns)
-        non_null_cells = total_cells - df.isnull().sum().sum()
-        completeness_ratio = non_null_cells / total_cells if total_cells > 0 else 0
+        stats = stats or DataFrameStats(df)
+        total_cells = stats.total_cells
+        non_null_cells = total_cells - stats.total_null
+        completeness_ratio = stats.completeness_ratio
         
         return {
             'completeness_ratio': round(completeness_ratio, 4),
@@ -1,28 +1,44 @@
 # test_day1_pipeline.py
 # Day 1: Complete pipeline testing and verification
 
+import importlib
+import json
 import os
 import sys
-import pandas as pd
-from datetime import datetime
+from unittest import mock
+import pytest
+
+from tests._fscache import clear_cache, missing_paths
+
+WEATHER_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests", "fixtures", "weather.json")
+
+@pytest.fixture(scope="module")
+def weather_response():
+    """Recorded OpenWeatherMap response, loaded once instead of calling the API"""
+    with open(WEATHER_FIXTURE) as f:
+        return json.load(f)
+
+@pytest.fixture(scope="module", autouse=True)
+def _fresh_listings():
+    """Directory listings are cached; start and end this module with an empty cache"""
+    clear_cache()
+    yield
+    clear_cache()
 
 def test_file_structure():
     """Test Day 1 file structure"""
     required_files = [
         "src/data_collection.py",
-        "src/synthetic_generators.py", 
+        "src/synthetic_generators.py",
         "src/data_validation.py",
         "src/main_pipeline.py",
         "src/utils.py",
         "requirements.txt"
     ]
     
-    missing_files = []
-    for file in required_files:
-        if not os.path.exists(file):
-            missing_files.append(file)
+    missing_files = missing_paths(required_files)
     
-    return len(missing_files) == 0, missing_files
+    assert not missing_files, f"Missing files: {missing_files}"
 
 def test_data_files():
     """Test required data files exist"""
@@ -33,188 +49,237 @@ def test_data_files():
         "data/processed/traffic-accidents-annual.xlsx"
     ]
     
-    existing_files = []
-    missing_files = []
-    
-    for file in data_files:
-        if os.path.exists(file):
-            existing_files.append(file)
-        else:
-            missing_files.append(file)
+    missing_files = missing_paths(data_files)
     
-    return len(missing_files) == 0, existing_files, missing_files
+    assert not missing_files, f"Missing data files: {missing_files}"
 
 def test_imports():
     """Test Day 1 module imports"""
-    try:
-        # Test basic imports
-        import pandas as pd
-        import numpy as np
-        import requests
-        
-        # Test custom modules
-        sys.path.append('src')
-        from data_collection import LahoreDataCollector
-        from synthetic_generators import LahoreSyntheticGenerator
-        from data_validation import SmartCityDataValidator
-        from main_pipeline import Day1Pipeline
-        import utils
-        
-        return True, "All imports successful"
-        
-    except Exception as e:
-        return False, f"Import error: {str(e)}"
-
-def test_data_collection():
+    # pandas, numpy and requests come in through the pipeline modules themselves
+    for module_name in ['data_collection', 'synthetic_generators', 'data_validation', 'main_pipeline', 'utils']:
+        importlib.import_module(module_name)
+
+@pytest.mark.slow
+def test_data_collection(vehicle_df):
     """Test data collection functionality"""
-    try:
-        sys.path.append('src')
-        from data_collection import LahoreDataCollector
-        
-        # Test initialization
-        collector = LahoreDataCollector("test_api_key")
-        
-        # Test vehicle data loading if file exists
-        if os.path.exists("data/processed/motor-vehicles-registered-by-type-division-and-district-the-punjab-uptil-2021.csv"):
-            vehicle_data = collector.collect_traffic_data()
-            if vehicle_data and 'vehicles' in vehicle_data and vehicle_data['vehicles'] is not None:
-                return True, f"Vehicle data loaded: {len(vehicle_data['vehicles'])} records"
-        
-        return True, "Data collection module functional (no data files to test)"
-        
-    except Exception as e:
-        return False, f"Data collection error: {str(e)}"
+    from data_collection import LahoreDataCollector
+    
+    # Test initialization
+    collector = LahoreDataCollector("test_api_key")
+    
+    # Test vehicle data loading from the session-wide parsed CSV
+    vehicle_data = collector.collect_traffic_data(vehicles_df=vehicle_df)
+    assert vehicle_data and vehicle_data.get('vehicles') is not None, "Vehicle data not loaded"
+    assert len(vehicle_data['vehicles']) > 0, "No Lahore vehicle records"
 
+@pytest.mark.slow
 def test_synthetic_generation():
     """Test synthetic data generation"""
-    try:
-        sys.path.append('src')
-        from synthetic_generators import LahoreSyntheticGenerator
-        
-        generator = LahoreSyntheticGenerator()
-        
-        # Test energy generation (smaller dataset for testing)
-        energy_data = generator.generate_energy_data(1000000)
-        if len(energy_data) == 0:
-            return False, "No energy data generated"
-        
-        # Test emergency generation (smaller dataset)
-        emergency_data = generator.generate_emergency_data()
-        if len(emergency_data) == 0:
-            return False, "No emergency data generated"
-        
-        return True, f"Synthetic data: {len(energy_data)} energy, {len(emergency_data)} emergency records"
-        
-    except Exception as e:
-        return False, f"Synthetic generation error: {str(e)}"
+    from synthetic_generators import LahoreSyntheticGenerator
+    
+    generator = LahoreSyntheticGenerator()
+    
+    # Test energy generation (smaller dataset for testing)
+    energy_data = generator.generate_energy_data(1000000)
+    assert len(energy_data) > 0, "No energy data generated"
+    
+    # Test emergency generation (smaller dataset)
+    emergency_data = generator.generate_emergency_data()
+    assert len(emergency_data) > 0, "No emergency data generated"
+
+# Documented 311 tables: base resolution hours per service type, scaled by priority
+RESOLUTION_BASE_HOURS = {
+    'Emergency Response': 1, 'Electrical Hazard': 4, 'Water Main Break': 8,
+    'Traffic Signal Malfunction': 6, 'Street Light Out': 24, 'Road Damage/Pothole': 72,
+    'Public Health Concern': 12, 'Infrastructure Damage': 48, 'Tree Down/Damage': 24,
+    'Noise Complaint': 48, 'Garbage Collection': 24, 'Animal Control': 12
+}
+SERVICE_WEIGHTS = {
+    'Traffic Signal Malfunction': 0.15, 'Road Damage/Pothole': 0.12, 'Street Light Out': 0.10,
+    'Water Main Break': 0.08, 'Noise Complaint': 0.07, 'Garbage Collection': 0.08,
+    'Tree Down/Damage': 0.06, 'Electrical Hazard': 0.05, 'Animal Control': 0.04,
+    'Public Health Concern': 0.06, 'Infrastructure Damage': 0.09, 'Emergency Response': 0.10
+}
+
+def _expected_resolution_hours(service_type, priority):
+    base = RESOLUTION_BASE_HOURS[service_type]
+    if priority == 'High':
+        return max(1, int(base * 0.5))
+    if priority == 'Medium':
+        return base
+    return int(base * 1.5)
+
+@pytest.fixture(scope="module")
+def emergency_df():
+    """Seeded synthetic 311 requests, generated once for the distribution tests"""
+    from synthetic_generators import LahoreSyntheticGenerator
+    return LahoreSyntheticGenerator().generate_emergency_data()
+
+def test_cdf_sampler_proportions():
+    """Categorical sampler reproduces its probabilities and values"""
+    import numpy as np
+    from synthetic_generators import _CDFSampler
+    
+    sampler = _CDFSampler([0.1, 0.4, 0.5], values=['a', 'b', 'c'])
+    draws = sampler.sample(200000, np.random.default_rng(0))
+    assert set(draws) == {'a', 'b', 'c'}
+    for value, p in zip('abc', [0.1, 0.4, 0.5]):
+        assert abs((draws == value).mean() - p) < 0.005
+
+def test_emergency_is_seeded():
+    """Two generators with the default seed produce the same requests"""
+    from synthetic_generators import LahoreSyntheticGenerator
+    
+    first = LahoreSyntheticGenerator().generate_emergency_data()
+    second = LahoreSyntheticGenerator().generate_emergency_data()
+    columns = ['request_id', 'service_type', 'priority', 'status', 'latitude', 'estimated_resolution_hours']
+    assert first[columns].equals(second[columns])
+
+def test_emergency_service_and_hour_distribution(emergency_df):
+    """Service types and request hours follow the documented weights"""
+    import numpy as np
+    from synthetic_generators import LahoreSyntheticGenerator
+    
+    total = sum(SERVICE_WEIGHTS.values())
+    shares = emergency_df['service_type'].value_counts(normalize=True)
+    assert set(shares.index) == set(SERVICE_WEIGHTS)
+    for service, weight in SERVICE_WEIGHTS.items():
+        assert abs(shares[service] - weight / total) < 0.01, service
+    
+    hour_shares = np.bincount(emergency_df['timestamp'].dt.hour, minlength=24) / len(emergency_df)
+    assert np.abs(hour_shares - LahoreSyntheticGenerator._HOUR_PROBS).max() < 0.01
+
+def test_emergency_priority_rules(emergency_df):
+    """Critical services are always High, the rest follow their priority mixes"""
+    service, priority = emergency_df['service_type'], emergency_df['priority']
+    
+    always_high = service.isin(['Emergency Response', 'Electrical Hazard', 'Water Main Break'])
+    assert (priority[always_high] == 'High').all()
+    
+    mostly_high = service.isin(['Traffic Signal Malfunction', 'Public Health Concern'])
+    assert set(priority[mostly_high]) == {'High', 'Medium'}
+    assert abs((priority[mostly_high] == 'High').mean() - 0.7) < 0.02
+    
+    others = priority[~always_high & ~mostly_high].value_counts(normalize=True)
+    for level, p in {'High': 0.1, 'Medium': 0.4, 'Low': 0.5}.items():
+        assert abs(others[level] - p) < 0.02, level
+
+def test_emergency_resolution_hours(emergency_df):
+    """Resolution hours match the service x priority table for every request"""
+    import pandas as pd
+    
+    pairs = emergency_df[['service_type', 'priority']].drop_duplicates()
+    expected = pd.Series([_expected_resolution_hours(s, p) for s, p in pairs.itertuples(index=False)],
+                         index=pd.MultiIndex.from_frame(pairs))
+    actual = pd.MultiIndex.from_frame(emergency_df[['service_type', 'priority']])
+    assert (emergency_df['estimated_resolution_hours'].to_numpy() == expected.reindex(actual).to_numpy()).all()
+    # always-High x1, High/Medium x2, the other seven services x3
+    assert len(pairs) == 3 * 1 + 2 * 2 + 7 * 3
+
+def test_emergency_status_by_age(emergency_df):
+    """Older requests are mostly closed, recent ones mostly open or in progress"""
+    import pandas as pd
+    
+    # Stay a day clear of the 7 and 30 day boundaries
+    days_old = (pd.Timestamp.now() - emergency_df['timestamp']).dt.days
+    expected = {
+        'old': (days_old > 31, {'Open': 0.1, 'In Progress': 0.1, 'Closed': 0.7, 'Pending': 0.1}),
+        'aging': ((days_old > 8) & (days_old < 30), {'Open': 0.2, 'In Progress': 0.3, 'Closed': 0.4, 'Pending': 0.1}),
+        'recent': (days_old < 6, {'Open': 0.4, 'In Progress': 0.4, 'Closed': 0.1, 'Pending': 0.1})
+    }
+    for band, (mask, probs) in expected.items():
+        shares = emergency_df.loc[mask, 'status'].value_counts(normalize=True)
+        for status, p in probs.items():
+            assert abs(shares[status] - p) < 0.02, (band, status)
+
+def test_energy_demand_profile():
+    """Evening peak vs night trough and sector split follow the demand factors"""
+    from synthetic_generators import LahoreSyntheticGenerator
+    
+    energy = LahoreSyntheticGenerator().generate_energy_data()
+    by_hour = energy.groupby(energy['timestamp'].dt.hour)['total_consumption_mw'].mean()
+    assert abs(by_hour[20] / by_hour[3] - 1.4 / 0.6) < 0.1
+    
+    shares = energy[['residential_mw', 'commercial_mw', 'industrial_mw']].div(energy['total_consumption_mw'], axis=0)
+    assert (shares.sub([0.45, 0.35, 0.20]).abs() < 1e-5).all().all()
 
 def test_validation():
     """Test data validation functionality"""
-    try:
-        sys.path.append('src')
-        from data_validation import SmartCityDataValidator
-        
-        validator = SmartCityDataValidator()
-        
-        # Test with sample data
-        sample_df = pd.DataFrame({
+    import pandas as pd
+    from data_validation import SmartCityDataValidator
+    
+    validator = SmartCityDataValidator()
+    
+    # Test with sample data
+    sample_df = pd.DataFrame({
+        'Division/ District': ['Lahore', 'Karachi'],
+        'Total': [1000000, 2000000],
+        'Motor Cars, Jeeps and Station Wagons': [500000, 800000]
+    })
+    
+    validation_result = validator.validate_vehicle_data(sample_df)
+    
+    assert 'quality_score' in validation_result, "Validation missing quality score"
+
+def test_parallel_validation_matches_serial(monkeypatch):
+    """Process-pool validation gives the same results as the in-process path"""
+    import pandas as pd
+    import data_validation
+    from synthetic_generators import LahoreSyntheticGenerator
+    
+    generator = LahoreSyntheticGenerator()
+    datasets = {
+        'traffic_vehicles': pd.DataFrame({
             'Division/ District': ['Lahore', 'Karachi'],
             'Total': [1000000, 2000000],
             'Motor Cars, Jeeps and Station Wagons': [500000, 800000]
-        })
-        
-        validation_result = validator.validate_vehicle_data(sample_df)
-        
-        if 'quality_score' not in validation_result:
-            return False, "Validation missing quality score"
-        
-        return True, f"Validation functional, quality score: {validation_result['quality_score']}"
-        
-    except Exception as e:
-        return False, f"Validation error: {str(e)}"
-
-def test_complete_pipeline():
-    """Test complete Day 1 pipeline initialization"""
-    try:
-        sys.path.append('src')
-        from main_pipeline import Day1Pipeline
-        
-        # Test pipeline initialization
-        pipeline = Day1Pipeline("a43d06572c2fb3c2b1b6ccd76a8ce7e4")
-        
-        return True, "Pipeline initialization successful"
-        
-    except Exception as e:
-        return False, f"Pipeline error: {str(e)}"
-
-def run_day1_tests():
-    """Run all Day 1 tests"""
-    print("🧪 Day 1 Pipeline Testing")
-    print("=" * 40)
-    print(f"Test started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    
-    tests = [
-        ("File Structure", test_file_structure),
-        ("Data Files", test_data_files),
-        ("Module Imports", test_imports),
-        ("Data Collection", test_data_collection),
-        ("Synthetic Generation", test_synthetic_generation),
-        ("Data Validation", test_validation),
-        ("Complete Pipeline", test_complete_pipeline)
-    ]
+        }),
+        'energy': generator.generate_energy_data(),
+        'emergency': generator.generate_emergency_data()
+    }
+    
+    validator = data_validation.SmartCityDataValidator()
+    validator.max_workers = 2
+    serial = validator.run_comprehensive_validation(datasets)
+    
+    monkeypatch.setattr(data_validation, 'PARALLEL_MIN_ROWS', 0)
+    with mock.patch.object(data_validation, 'ProcessPoolExecutor',
+                           wraps=data_validation.ProcessPoolExecutor) as pool:
+        parallel = validator.run_comprehensive_validation(datasets)
+    
+    assert pool.called, "Process pool was not used"
+    assert parallel['dataset_validations'] == serial['dataset_validations']
+    assert parallel['summary'] == serial['summary']
+
+@pytest.mark.slow
+def test_complete_pipeline(weather_response, tmp_path):
+    """Test complete Day 1 pipeline run, through export, with the weather API stubbed out"""
+    from data_collection import LahoreDataCollector
+    from main_pipeline import Day1Pipeline
+    
+    pipeline = Day1Pipeline("a43d06572c2fb3c2b1b6ccd76a8ce7e4")
+    
+    with mock.patch.object(LahoreDataCollector, "collect_weather_data", return_value=weather_response):
+        results = pipeline.run_complete_pipeline(output_dir=str(tmp_path))
+    
+    collected = results['datasets']['collected']
+    assert results['pipeline_success']
+    assert pipeline.results['weather_data']['name'] == "Lahore"
+    assert collected, "No real datasets collected"
+    assert set(results['datasets']['synthetic']) == {'energy', 'emergency'}
+    
+    export_files = results['export_files']
+    assert {'synthetic_energy', 'synthetic_emergency', 'weather', 'validation'} <= set(export_files)
+    for file_path in export_files.values():
+        assert os.path.dirname(file_path) == str(tmp_path)
+        assert os.path.getsize(file_path) > 0, f"Empty export: {file_path}"
     
-    results = {}
-    
-    for test_name, test_function in tests:
-        try:
-            if test_name == "Data Files":
-                success, existing, missing = test_function()
-                results[test_name] = success
-                if success:
-                    print(f"✅ {test_name}: All required files found")
-                    print(f"   Found: {len(existing)} data files")
-                else:
-                    print(f"⚠️ {test_name}: Missing files: {len(missing)}")
-                    print(f"   Found: {len(existing)} files")
-                    for missing_file in missing:
-                        print(f"   ❌ {missing_file}")
-            else:
-                success, message = test_function()
-                results[test_name] = success
-                status = "✅" if success else "❌"
-                print(f"{status} {test_name}: {message}")
-                
-        except Exception as e:
-            results[test_name] = False
-            print(f"❌ {test_name}: Test crashed - {str(e)}")
-    
-    # Summary
-    print("\n" + "=" * 40)
-    print("📋 TEST SUMMARY")
-    print("=" * 40)
-    
-    passed = sum(results.values())
-    total = len(results)
-    
-    for test_name, success in results.items():
-        status = "✅ PASSED" if success else "❌ FAILED"
-        print(f"{test_name:<20} {status}")
-    
-    print(f"\nOverall: {passed}/{total} tests passed")
-    
-    if passed >= 6:  # All tests should pass now
-        print("\n🎉 ALL TESTS PASSED!")
-        print("Day 1 pipeline is ready for execution!")
-        print("\nNext steps:")
-        print("1. Run: python src/main_pipeline.py")
-        print("2. Check: day1_summary.json")
-        print("3. Verify: data/processed/ for outputs")
-    else:
-        print(f"\n⚠️ {total - passed} tests failed")
-        print("Please check the error messages above")
-    
-    return passed >= 6
+    summary = results['summary']
+    assert summary['data_quality']['datasets_validated'] == len(collected) + 2
+    assert summary['day2_readiness']['export_files_created'] == len(export_files)
+    assert summary['lahore_insights']['total_vehicles'] > 0
 
 if __name__ == "__main__":
-    success = run_day1_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    # Independent tests, sharded across all but two cores (pytest-xdist)
+    workers = max(1, (os.cpu_count() or 1) - 2)
+    sys.exit(pytest.main(["-n", str(workers), __file__]))
@@ -0,0 +1,35 @@
+# tests/_fscache.py
+# Cached file-existence checks for the test suite
+# Listings are cached for the whole process, so only use these for files that
+# do not change during a run (sources, data fixtures); call clear_cache() otherwise
+
+import os
+from collections import defaultdict
+from functools import lru_cache
+from typing import Iterable, List
+
+@lru_cache(maxsize=None)
+def _dir_entries(directory: str) -> frozenset:
+    """Names in a directory, listed with a single syscall"""
+    try:
+        with os.scandir(directory or '.') as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+def missing_paths(paths: Iterable[str]) -> List[str]:
+    """Paths that do not exist, checked with one directory scan per parent"""
+    by_directory = defaultdict(list)
+    for path in paths:
+        directory, name = os.path.split(os.path.normpath(path))
+        by_directory[directory].append((path, name))
+    
+    missing = []
+    for directory, entries in by_directory.items():
+        present = _dir_entries(directory)
+        missing.extend(path for path, name in entries if name not in present)
+    return missing
+
+def clear_cache() -> None:
+    """Forget cached listings, e.g. after files were created or removed"""
+    _dir_entries.cache_clear()
@@ -3,6 +3,55 @@
 
 import pandas as pd
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+# Rows per CSV chunk, so memory stays bounded however large a file grows
+CSV_CHUNK_ROWS = 256_000
+
+def _verify_one(name: str, file_path: str) -> List[str]:
+    """Check one data file and return its report lines"""
+    lines = [f"\n📁 {name}", f"   Path: {file_path}"]
+    
+    if os.path.exists(file_path):
+        try:
+            # CSVs: header only, then the one needed column streamed in bounded chunks.
+            # Workbooks have no chunked reader, so they are parsed once by calamine.
+            if file_path.endswith('.csv'):
+                columns = list(pd.read_csv(file_path, nrows=0).columns)
+            else:
+                workbook = pd.read_excel(file_path, engine='calamine')
+                columns = list(workbook.columns)
+            district_col = next((col for col in ('Division/ District', 'DISTRICT') if col in columns), None)
+            usecols = [district_col or columns[0]]
+            
+            if file_path.endswith('.csv'):
+                chunks = pd.read_csv(file_path, usecols=usecols, dtype=str, chunksize=CSV_CHUNK_ROWS)
+            else:
+                chunks = [workbook[usecols]]
+            
+            row_count = 0
+            lahore_count = 0
+            for chunk in chunks:
+                row_count += len(chunk)
+                if district_col is not None:
+                    lahore_count += int(chunk[district_col].str.contains('Lahore', case=False, na=False, regex=False).sum())
+            
+            lines.append(f"   ✅ File loaded successfully")
+            lines.append(f"   📊 Shape: {row_count} rows, {len(columns)} columns")
+            lines.append(f"   📋 Columns: {columns[:3]}{'...' if len(columns) > 3 else ''}")
+            
+            # Check for Lahore data
+            if district_col is not None:
+                lines.append(f"   🏙️ Lahore records: {lahore_count}")
+            
+        except Exception as e:
+            lines.append(f"   ❌ Error loading file: {e}")
+    else:
+        lines.append(f"   ❌ File not found")
+    
+    return lines
 
 def verify_data_files():
     """Verify that data files exist and can be loaded"""
@@ -14,39 +63,17 @@ def verify_data_files():
         "Traffic Annual": "data/processed/traffic-accidents-annual.xlsx"
     }
     
-    print("🔍 Verifying Data Files")
-    print("=" * 50)
+    lines = ["🔍 Verifying Data Files", "=" * 50]
+    
+    # Files are independent, so their reads overlap; reports print in input order
+    with ThreadPoolExecutor(max_workers=min(len(data_files), os.cpu_count() or 1)) as executor:
+        for report in executor.map(_verify_one, data_files.keys(), data_files.values()):
+            lines.extend(report)
     
-    for name, file_path in data_files.items():
-        print(f"\n📁 {name}")
-        print(f"   Path: {file_path}")
-        
-        if os.path.exists(file_path):
-            try:
-                # Load file based on extension
-                if file_path.endswith('.csv'):
-                    df = pd.read_csv(file_path)
-                else:  # Excel file
-                    df = pd.read_excel(file_path)
-                
-                print(f"   ✅ File loaded successfully")
-                print(f"   📊 Shape: {df.shape[0]} rows, {df.shape[1]} columns")
-                print(f"   📋 Columns: {list(df.columns[:3])}{'...' if len(df.columns) > 3 else ''}")
-                
-                # Check for Lahore data
-                if 'Division/ District' in df.columns:
-                    lahore_count = df[df['Division/ District'].str.contains('Lahore', case=False, na=False)].shape[0]
-                    print(f"   🏙️ Lahore records: {lahore_count}")
-                elif 'DISTRICT' in df.columns:
-                    lahore_count = df[df['DISTRICT'].str.contains('Lahore', case=False, na=False)].shape[0]
-                    print(f"   🏙️ Lahore records: {lahore_count}")
-                
-            except Exception as e:
-                print(f"   ❌ Error loading file: {e}")
-        else:
-            print(f"   ❌ File not found")
+    lines.append(f"\n🎯 All data files verified! Ready to run pipeline.")
     
-    print(f"\n🎯 All data files verified! Ready to run pipeline.")
+    # Whole report goes out in one write instead of a print per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     verify_data_files()
\ No newline at end of file